@@ -5,9 +5,12 @@ from datetime import datetime, timedelta
 
 from models import PastaInfo, TimerEvent
 from pasta_database import PastaDatabase
-from timer import TimerObserver, PastaTimer, TimerManager, NotificationManager
+from timer import TimerObserver, PastaTimer, TimerManager, NotificationManager, DEBUG_TIMER_SECONDS
 from validators import CustomPastaValidator
 
+# Resolved once at import rather than on every screen refresh
+_CLEAR_COMMAND = 'cls' if os.name == 'nt' else 'clear'
+
 class CLIInterface(TimerObserver):
     """Command-line interface for the pasta timer with multiple timer support"""
     
@@ -20,6 +23,7 @@ class CLIInterface(TimerObserver):
         self.display_mode = 'menu'  # 'menu' or 'monitoring'
         self.monitoring_active = False
         self.last_screen_update = time.time()
+        self._bar_cache: Dict[int, List[str]] = {}  # bar_length -> bar for each fill level
         
         # Show notification capabilities on startup
         capabilities = self.notification_manager.get_capabilities()
@@ -63,7 +67,7 @@ class CLIInterface(TimerObserver):
         """Display all available pasta types and return the list in display order"""
         built_in = self.pasta_db.get_built_in_pasta_types()
         custom = self.pasta_db.get_custom_pasta_types()
-        pasta_list = built_in + custom
+        pasta_list = list(built_in) + custom
 
         print("\n🍝 Available Pasta Types:")
         print("=" * 50)
@@ -110,7 +114,7 @@ class CLIInterface(TimerObserver):
             raise ValueError(f"Unknown pasta type: {pasta_type}")
         
         if self.debug_mode:
-            return 0.1  # 6 seconds in minutes
+            return DEBUG_TIMER_SECONDS / 60
         
         if pasta_info.min_time == pasta_info.max_time:
             return float(pasta_info.min_time)
@@ -354,7 +358,7 @@ class CLIInterface(TimerObserver):
         
         while True:
             name = input("Enter pasta name: ").strip()
-            existing_names = self.pasta_db.get_pasta_names()
+            existing_names = self.pasta_db.get_lowercase_names()
             is_valid, error = CustomPastaValidator.validate_pasta_name(name, existing_names)
             if is_valid:
                 break
@@ -562,12 +566,17 @@ class CLIInterface(TimerObserver):
     
     def _clear_screen(self) -> None:
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        os.system(_CLEAR_COMMAND)
     
     def _render_progress_bar(self, total_seconds: int, remaining_seconds: int, bar_length: int = 30) -> str:
         """Render a progress bar"""
-        elapsed = total_seconds - remaining_seconds
-        percent = elapsed / total_seconds if total_seconds else 0
-        filled_length = int(bar_length * percent)
-        bar = '█' * filled_length + '-' * (bar_length - filled_length)
-        return f"[{bar}] {int(percent * 100):3d}%"
\ No newline at end of file
+        bars = self._bar_cache.get(bar_length)
+        if bars is None:
+            bars = ['█' * i + '-' * (bar_length - i) for i in range(bar_length + 1)]
+            self._bar_cache[bar_length] = bars
+        
+        elapsed = min(max(total_seconds - remaining_seconds, 0), total_seconds)
+        if not total_seconds:
+            return f"[{bars[0]}]   0%"
+        filled_length = bar_length * elapsed // total_seconds
+        return f"[{bars[filled_length]}] {elapsed * 100 // total_seconds:3d}%"
\ No newline at end of file
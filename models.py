@@ -13,7 +13,7 @@ class TimerState(Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class PastaInfo:
     """Data class representing pasta information"""
     name: str
@@ -35,7 +35,7 @@ class PastaInfo:
         self.usage_count += 1
 
 
-@dataclass
+@dataclass(slots=True)
 class TimerEvent:
     """Data class representing timer events"""
     event_type: str
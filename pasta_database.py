@@ -1,5 +1,5 @@
 import random
-from typing import Dict, List, Optional
+from typing import AbstractSet, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from models import PastaInfo
@@ -7,6 +7,20 @@ from storage import PastaStorage
 from validators import CustomPastaValidator
 
 
+FUN_FACTS = (
+    "Did you know? The word 'pasta' comes from the Italian word for 'paste.'",
+    "Tip: Always salt your pasta water for better flavor!",
+    "Fact: There are over 600 shapes of pasta worldwide.",
+    "Tip: Don't rinse your pasta after cooking; the starch helps sauce stick!",
+    "Fact: Al dente means 'to the tooth' in Italian, describing pasta's ideal texture.",
+    "Tip: Save a cup of pasta water to help thicken your sauce.",
+    "Fact: Pasta was first referenced in Sicily in 1154.",
+    "Tip: Stir pasta occasionally to prevent sticking.",
+    "Fact: The average Italian eats 51 pounds of pasta per year!",
+    "Tip: Pair pasta shapes with the right sauce for best results.",
+)
+
+
 class PastaDatabase:
     """Manages pasta types and their cooking information"""
     
@@ -21,27 +35,20 @@ class PastaDatabase:
             "angel hair": PastaInfo("angel hair", 3, 5),
             "fettuccine": PastaInfo("fettuccine", 9, 11)
         }
+        # Built-in types never change, so hand out the same tuple every time
+        self._built_in_types = tuple(self._built_in_pasta.values())
         
         self._custom_pasta = {}
+        self._all_pasta: Dict[str, PastaInfo] = {}  # lowercase name -> info, custom shadowing built-in
         self._storage = PastaStorage()
         self._load_custom_pasta()
         
-        self._fun_facts = [
-            "Did you know? The word 'pasta' comes from the Italian word for 'paste.'",
-            "Tip: Always salt your pasta water for better flavor!",
-            "Fact: There are over 600 shapes of pasta worldwide.",
-            "Tip: Don't rinse your pasta after cooking; the starch helps sauce stick!",
-            "Fact: Al dente means 'to the tooth' in Italian, describing pasta's ideal texture.",
-            "Tip: Save a cup of pasta water to help thicken your sauce.",
-            "Fact: Pasta was first referenced in Sicily in 1154.",
-            "Tip: Stir pasta occasionally to prevent sticking.",
-            "Fact: The average Italian eats 51 pounds of pasta per year!",
-            "Tip: Pair pasta shapes with the right sauce for best results."
-        ]
+        self._fun_facts = FUN_FACTS
     
     def _load_custom_pasta(self) -> None:
         """Load custom pasta types from storage"""
         self._custom_pasta = self._storage.load_custom_pasta()
+        self._all_pasta = {**self._built_in_pasta, **self._custom_pasta}
     
     def _save_custom_pasta(self) -> bool:
         """Save custom pasta types to storage"""
@@ -49,23 +56,15 @@ class PastaDatabase:
     
     def get_pasta_info(self, pasta_name: str) -> Optional[PastaInfo]:
         """Get pasta information by name"""
-        name_lower = pasta_name.lower()
-        
-        # Check custom pasta first
-        if name_lower in self._custom_pasta:
-            return self._custom_pasta[name_lower]
-        
-        # Check built-in pasta
-        return self._built_in_pasta.get(name_lower)
+        return self._all_pasta.get(pasta_name.lower())
     
     def get_all_pasta_types(self) -> List[PastaInfo]:
         """Get all available pasta types (built-in + custom)"""
-        all_pasta = list(self._built_in_pasta.values()) + list(self._custom_pasta.values())
-        return sorted(all_pasta, key=lambda p: p.name)
+        return sorted(self._all_pasta.values(), key=lambda p: p.name)
     
-    def get_built_in_pasta_types(self) -> List[PastaInfo]:
+    def get_built_in_pasta_types(self) -> Tuple[PastaInfo, ...]:
         """Get only built-in pasta types"""
-        return list(self._built_in_pasta.values())
+        return self._built_in_types
     
     def get_custom_pasta_types(self) -> List[PastaInfo]:
         """Get only custom pasta types"""
@@ -73,12 +72,16 @@ class PastaDatabase:
     
     def get_pasta_names(self) -> List[str]:
         """Get list of all pasta names"""
-        return [p.name for p in self.get_all_pasta_types()]
+        return [p.name for p in self._all_pasta.values()]
+    
+    def get_lowercase_names(self) -> AbstractSet[str]:
+        """Get a live set view of all pasta names, lowercased, for duplicate checks"""
+        return self._all_pasta.keys()
     
     def add_custom_pasta(self, name: str, min_time: int, max_time: int) -> bool:
         """Add a custom pasta type"""
         # Validate input
-        existing_names = self.get_pasta_names()
+        existing_names = self.get_lowercase_names()
         is_valid_name, name_error = CustomPastaValidator.validate_pasta_name(name, existing_names)
         if not is_valid_name:
             raise ValueError(name_error)
@@ -99,6 +102,7 @@ class PastaDatabase:
         
         # Add to custom pasta and save
         self._custom_pasta[name.lower()] = pasta_info
+        self._all_pasta[name.lower()] = pasta_info
         return self._save_custom_pasta()
     
     def remove_custom_pasta(self, name: str) -> bool:
@@ -106,6 +110,10 @@ class PastaDatabase:
         name_lower = name.lower()
         if name_lower in self._custom_pasta:
             del self._custom_pasta[name_lower]
+            if name_lower in self._built_in_pasta:
+                self._all_pasta[name_lower] = self._built_in_pasta[name_lower]
+            else:
+                del self._all_pasta[name_lower]
             return self._save_custom_pasta()
         return False
     
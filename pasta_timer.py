@@ -1,6 +1,7 @@
 import argparse
 from pasta_database import PastaDatabase
 from cli_interface import CLIInterface
+from timer import DEBUG_TIMER_SECONDS
 
 __version__ = "1.0.0"
 
@@ -87,10 +88,10 @@ def main():
     parser = argparse.ArgumentParser(
         description="🍝 Pasta Timer - Never overcook your pasta again!",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+        epilog=f"""
 Examples:
   python pasta_timer.py              # Normal mode
-  python pasta_timer.py --debug      # Debug mode (6 second timers)
+  python pasta_timer.py --debug      # Debug mode ({DEBUG_TIMER_SECONDS} second timers)
   python pasta_timer.py -d           # Debug mode (short form)
         """
     )
@@ -98,7 +99,7 @@ Examples:
     parser.add_argument(
         "-d", "--debug",
         action="store_true",
-        help="Enable debug mode (all timers will run for 6 seconds only)"
+        help=f"Enable debug mode (all timers will run for {DEBUG_TIMER_SECONDS} seconds only)"
     )
     
     parser.add_argument(
@@ -110,7 +111,7 @@ Examples:
     args = parser.parse_args()
     
     if args.debug:
-        print("🔧 DEBUG MODE: All timers will run for 6 seconds only")
+        print(f"🔧 DEBUG MODE: All timers will run for {DEBUG_TIMER_SECONDS} seconds only")
     
     app = PastaTimerApp(debug_mode=args.debug)
     app.run()
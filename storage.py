@@ -5,6 +5,26 @@ from datetime import datetime
 
 from models import PastaInfo
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _json_loads(raw: bytes) -> Dict:
+    """Parse JSON bytes, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _json_dumps(data: Dict) -> bytes:
+    """Serialize to indented UTF-8 JSON, using orjson when it is installed"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
 
 class PastaStorage:
     """Handles persistent storage of custom pasta types"""
@@ -19,8 +39,8 @@ class PastaStorage:
             if not os.path.exists(self.filename):
                 return {}
             
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.filename, 'rb') as f:
+                data = _json_loads(f.read())
             
             custom_pasta = {}
             pasta_data = data.get('custom_pasta', {})
@@ -37,7 +57,7 @@ class PastaStorage:
             
             return custom_pasta
             
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (KeyError, ValueError) as e:  # ValueError covers both parsers' decode errors
             print(f"Warning: Could not load custom pasta data: {e}")
             return {}
     
@@ -72,8 +92,8 @@ class PastaStorage:
             }
             
             # Save to file
-            with open(self.filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(self.filename, 'wb') as f:
+                f.write(_json_dumps(data))
             
             return True
             
@@ -1,13 +1,13 @@
 import streamlit as st
 import time
-import threading
+import queue
+import functools
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 
 from pasta_database import PastaDatabase
-from timer import TimerManager, NotificationManager, TimerObserver
+from timer import TimerManager, NotificationManager, TimerObserver, DEBUG_TIMER_SECONDS
 from models import TimerEvent, PastaInfo
-from validators import CustomPastaValidator
 
 # Configure Streamlit page
 st.set_page_config(
@@ -17,38 +17,38 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Refresh rate when nothing is about to finish
+IDLE_REFRESH_SECONDS = 2.0
+
 class StreamlitTimerObserver(TimerObserver):
     """Observer for Streamlit GUI updates"""
     
     def __init__(self):
-        self.events = []
-        self.lock = threading.Lock()
+        self.events = queue.SimpleQueue()
     
     def on_timer_tick(self, event: TimerEvent) -> None:
-        with self.lock:
-            self.events.append(("tick", event))
+        self.events.put(("tick", event))
     
     def on_timer_finished(self, event: TimerEvent) -> None:
-        with self.lock:
-            self.events.append(("finished", event))
+        self.events.put(("finished", event))
     
     def on_timer_cancelled(self, event: TimerEvent) -> None:
-        with self.lock:
-            self.events.append(("cancelled", event))
+        self.events.put(("cancelled", event))
     
     def on_timer_paused(self, event: TimerEvent) -> None:
-        with self.lock:
-            self.events.append(("paused", event))
+        self.events.put(("paused", event))
     
     def on_timer_resumed(self, event: TimerEvent) -> None:
-        with self.lock:
-            self.events.append(("resumed", event))
+        self.events.put(("resumed", event))
     
     def get_and_clear_events(self):
-        with self.lock:
-            events = self.events.copy()
-            self.events.clear()
-            return events
+        events = []
+        while True:
+            try:
+                events.append(self.events.get_nowait())
+            except queue.Empty:
+                break
+        return events
 
 # Initialize session state
 def init_session_state():
@@ -84,6 +84,9 @@ def render_header():
 
 def render_sidebar():
     """Render the sidebar with debug mode and info"""
+    timer_manager = st.session_state.timer_manager
+    pasta_db = st.session_state.pasta_db
+    
     with st.sidebar:
         st.header("⚙️ Settings")
         
@@ -91,18 +94,18 @@ def render_sidebar():
         debug_mode = st.checkbox(
             "🔧 Debug Mode", 
             value=st.session_state.debug_mode,
-            help="All timers will run for 6 seconds only"
+            help=f"All timers will run for {DEBUG_TIMER_SECONDS} seconds only"
         )
         if debug_mode != st.session_state.debug_mode:
             st.session_state.debug_mode = debug_mode
             if debug_mode:
-                st.success("Debug mode enabled! All timers will run for 6 seconds.")
+                st.success(f"Debug mode enabled! All timers will run for {DEBUG_TIMER_SECONDS} seconds.")
         
         st.divider()
         
         # Timer statistics
         st.header("📊 Statistics")
-        active_timers = st.session_state.timer_manager.get_active_timers()
+        active_timers = timer_manager.get_active_timers()
         running_count = len([t for t in active_timers if t['status'] == 'running'])
         paused_count = len([t for t in active_timers if t['status'] == 'paused'])
         finished_count = len([t for t in active_timers if t['status'] == 'finished'])
@@ -113,14 +116,14 @@ def render_sidebar():
             st.metric("⏸️ Paused", paused_count)
         with col2:
             st.metric("✅ Finished", finished_count)
-            st.metric("📝 Custom Pasta", st.session_state.pasta_db.get_custom_pasta_count())
+            st.metric("📝 Custom Pasta", pasta_db.get_custom_pasta_count())
         
         st.divider()
         
         # Random pasta fact
         st.header("💡 Pasta Fact")
         if st.button("🎲 New Fact"):
-            st.session_state.sidebar_fact = st.session_state.pasta_db.get_random_fact()
+            st.session_state.sidebar_fact = pasta_db.get_random_fact()
         
         st.info(st.session_state.sidebar_fact)
 
@@ -176,7 +179,7 @@ def render_timer_creation(pasta_info: PastaInfo):
         )
     
     if st.session_state.debug_mode:
-        st.warning("⚠️ Debug mode: Timer will run for 6 seconds regardless of selected time")
+        st.warning(f"⚠️ Debug mode: Timer will run for {DEBUG_TIMER_SECONDS} seconds regardless of selected time")
     
     # Start timer button
     if st.button("🔥 Start Timer", type="primary", use_container_width=True):
@@ -214,7 +217,14 @@ def render_timer_creation(pasta_info: PastaInfo):
 
 def render_active_timers():
     """Render active timers display"""
-    active_timers = st.session_state.timer_manager.get_active_timers()
+    timer_manager = st.session_state.timer_manager
+    active_timers = timer_manager.get_active_timers()
+    
+    # Drop facts for timers that are no longer managed so the dict stays bounded
+    active_ids = {t['id'] for t in active_timers}
+    st.session_state.current_facts = {
+        k: v for k, v in st.session_state.current_facts.items() if k in active_ids
+    }
     
     if not active_timers:
         st.info("📭 No active timers")
@@ -223,8 +233,10 @@ def render_active_timers():
     st.header("🕐 Active Timers")
     
     # Clean up finished timers
-    st.session_state.timer_manager.cleanup_finished_timers()
+    timer_manager.cleanup_finished_timers()
     
+    now = datetime.now()
+    current_facts = st.session_state.current_facts
     for timer in active_timers:
         with st.container():
             col1, col2, col3, col4 = st.columns([3, 2, 2, 1])
@@ -248,7 +260,7 @@ def render_active_timers():
                     remaining_time = timedelta(seconds=remaining_seconds)
                     st.metric("Time Remaining", str(remaining_time))
                 else:
-                    elapsed = datetime.now() - timer['start_time']
+                    elapsed = now - timer['start_time']
                     st.metric("Total Time", str(elapsed).split('.')[0])
             
             with col3:
@@ -260,27 +272,32 @@ def render_active_timers():
                     st.progress(progress)
                     
                     # Show pasta fact if available
-                    if timer['id'] in st.session_state.current_facts:
+                    if timer['id'] in current_facts:
                         with st.expander("💡 Pasta Fact"):
-                            st.write(st.session_state.current_facts[timer['id']])
+                            st.write(current_facts[timer['id']])
             
             with col4:
                 if timer['status'] == 'running':
                     if st.button("⏸️", key=f"pause_{timer['id']}", help="Pause timer"):
-                        st.session_state.timer_manager.pause_timer(timer['id'])
+                        timer_manager.pause_timer(timer['id'])
                         st.rerun()
                 elif timer['status'] == 'paused':
                     if st.button("▶️", key=f"resume_{timer['id']}", help="Resume timer"):
-                        st.session_state.timer_manager.resume_timer(timer['id'])
+                        timer_manager.resume_timer(timer['id'])
                         st.rerun()
                 
                 if timer['status'] in ['running', 'paused']:
                     if st.button("❌", key=f"cancel_{timer['id']}", help="Cancel timer"):
-                        st.session_state.timer_manager.cancel_timer(timer['id'])
+                        timer_manager.cancel_timer(timer['id'])
                         st.rerun()
             
             st.divider()
 
+@functools.lru_cache(maxsize=256)
+def _format_created_date(created_date: str) -> str:
+    """Format an ISO creation timestamp as a date; cached since it never changes per pasta"""
+    return datetime.fromisoformat(created_date).strftime("%Y-%m-%d")
+
 def render_custom_pasta_management():
     """Render custom pasta management"""
     st.header("⭐ Manage Custom Pasta Types")
@@ -347,9 +364,8 @@ def render_custom_pasta_management():
                     with col2:
                         usage_text = "Never used" if pasta.usage_count == 0 else f"Used {pasta.usage_count} time{'s' if pasta.usage_count != 1 else ''}"
                         st.caption(usage_text)
-                        if hasattr(pasta, 'created_date'):
-                            created_date = datetime.fromisoformat(pasta.created_date).strftime("%Y-%m-%d")
-                            st.caption(f"Created: {created_date}")
+                        if pasta.created_date:
+                            st.caption(f"Created: {_format_created_date(pasta.created_date)}")
                     
                     with col3:
                         if st.button("🗑️", key=f"delete_{pasta.name}", help=f"Delete {pasta.name}"):
@@ -379,6 +395,14 @@ def process_timer_events():
             st.success(f"🍝 **{event.pasta_type.title()} is ready!** Time to eat!")
             st.balloons()
 
+def get_refresh_interval(min_remaining: int) -> float:
+    """Seconds until the next rerun, based on the running timer closest to finishing"""
+    if min_remaining < 10:
+        return 0.25
+    if min_remaining > 60:
+        return IDLE_REFRESH_SECONDS
+    return 1.0
+
 def main():
     """Main Streamlit application"""
     init_session_state()
@@ -406,8 +430,12 @@ def main():
     
     # Auto-refresh for timer updates (only if we have active timers)
     active_timers = st.session_state.timer_manager.get_active_timers()
-    if any(t['status'] in ['running', 'paused'] for t in active_timers):
-        time.sleep(1)
+    running_remaining = [t['remaining_seconds'] for t in active_timers if t['status'] == 'running']
+    if running_remaining:
+        time.sleep(get_refresh_interval(min(running_remaining)))
+        st.rerun()
+    elif any(t['status'] == 'paused' for t in active_timers):
+        time.sleep(IDLE_REFRESH_SECONDS)
         st.rerun()
 
 if __name__ == "__main__":
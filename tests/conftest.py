@@ -0,0 +1,19 @@
+import sys
+import time
+import pathlib
+
+import pytest
+
+# Make the top-level modules importable once for the whole test session
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "no_fast_sleep: let time.sleep really sleep in this test")
+
+
+@pytest.fixture(autouse=True)
+def _fast_sleep(request, monkeypatch):
+    """Turn time.sleep into a no-op so UI pauses and countdowns never slow the suite"""
+    if request.node.get_closest_marker("no_fast_sleep") is None:
+        monkeypatch.setattr(time, "sleep", lambda _seconds: None)
@@ -1,6 +1,3 @@
-import sys
-import os
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
 from cli_interface import CLIInterface
 from pasta_database import PastaDatabase
@@ -19,7 +16,8 @@ class DummyDB(PastaDatabase):
     def get_pasta_names(self):
         return list(self._built_in_pasta.keys())
 
-@pytest.fixture
+# No test mutates the CLI or its database, so one instance serves the module
+@pytest.fixture(scope="module")
 def cli():
     return CLIInterface(pasta_db=DummyDB())
 
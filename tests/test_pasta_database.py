@@ -1,3 +1,4 @@
+import copy
 import pytest
 from pasta_database import PastaDatabase
 from models import PastaInfo
@@ -11,14 +12,19 @@ class DummyStorage:
         self.saved = custom_pasta
         return True
 
-def make_db():
+@pytest.fixture(scope="module")
+def base_db():
     db = PastaDatabase()
     db._storage = DummyStorage()
-    db._custom_pasta = {}
+    db._load_custom_pasta()
     return db
 
-def test_add_and_get_custom_pasta():
-    db = make_db()
+@pytest.fixture
+def db(base_db):
+    # Tests add and remove pasta, so each gets its own copy of the prototype
+    return copy.deepcopy(base_db)
+
+def test_add_and_get_custom_pasta(db):
     assert db.get_custom_pasta_count() == 0
     db.add_custom_pasta('TestPasta', 5, 10)
     assert db.get_custom_pasta_count() == 1
@@ -29,22 +35,19 @@ def test_add_and_get_custom_pasta():
     assert info.max_time == 10
     assert info.is_custom
 
-def test_remove_custom_pasta():
-    db = make_db()
+def test_remove_custom_pasta(db):
     db.add_custom_pasta('TestPasta', 5, 10)
     assert db.remove_custom_pasta('TestPasta')
     assert db.get_custom_pasta_count() == 0
 
-def test_increment_pasta_usage():
-    db = make_db()
+def test_increment_pasta_usage(db):
     db.add_custom_pasta('TestPasta', 5, 10)
     info = db.get_pasta_info('TestPasta')
     assert info.usage_count == 0
     db.increment_pasta_usage('TestPasta')
     assert info.usage_count == 1
 
-def test_get_random_fact():
-    db = make_db()
+def test_get_random_fact(db):
     fact = db.get_random_fact()
     assert isinstance(fact, str)
     assert len(fact) > 0 
\ No newline at end of file
@@ -1,5 +1,8 @@
+import time
+import threading
+from unittest.mock import Mock
 import pytest
-from timer import PastaTimer, TimerObserver
+from timer import PastaTimer, TimerObserver, TimerManager
 from models import TimerEvent, TimerState
 
 class DummyObserver(TimerObserver):
@@ -14,23 +17,25 @@ class DummyObserver(TimerObserver):
     def on_timer_cancelled(self, event):
         self.cancelled = True
 
-def test_add_remove_observer():
-    timer = PastaTimer('spaghetti', 0.1, debug_mode=True)
+@pytest.fixture
+def timer():
+    # Built fresh per test: copies would share the observer list and events
+    return PastaTimer('spaghetti', 0.1, debug_mode=True)
+
+def test_add_remove_observer(timer):
     obs = DummyObserver()
     timer.add_observer(obs)
-    assert obs in timer.observers
+    assert obs in timer.observers.values()
     timer.remove_observer(obs)
-    assert obs not in timer.observers
+    assert obs not in timer.observers.values()
 
-def test_timer_reset():
-    timer = PastaTimer('spaghetti', 0.1, debug_mode=True)
+def test_timer_reset(timer):
     timer.remaining_seconds = 0
     timer.reset()
     assert timer.state == TimerState.IDLE
     assert timer.remaining_seconds == timer.total_seconds
 
-def test_notify_observers():
-    timer = PastaTimer('spaghetti', 0.1, debug_mode=True)
+def test_notify_observers(timer):
     obs = DummyObserver()
     timer.add_observer(obs)
     timer._notify_observers('tick')
@@ -38,4 +43,76 @@ def test_notify_observers():
     timer._notify_observers('finished')
     assert obs.finished
     timer._notify_observers('cancelled')
-    assert obs.cancelled 
\ No newline at end of file
+    assert obs.cancelled
+
+@pytest.mark.no_fast_sleep
+def test_timer_manager_finishes_timer():
+    manager = TimerManager()
+    timer_id = manager.add_timer('spaghetti', 0)
+    observer = Mock()
+    assert manager.start_timer(timer_id, observer)
+    deadline = time.monotonic() + 2
+    while manager.get_active_timers()[0]['status'] == 'running' and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert manager.get_active_timers()[0]['status'] == 'finished'
+    observer.on_timer_finished.assert_called_once()
+
+@pytest.mark.no_fast_sleep
+def test_slow_pause_handler_does_not_stall_other_timers():
+    manager = TimerManager()
+    quick_id = manager.add_timer('spaghetti', 1 / 60)
+    slow_id = manager.add_timer('penne', 1)
+    quick, slow = Mock(), Mock()
+    slow.on_timer_paused.side_effect = lambda event: threading.Event().wait(1.5)
+    manager.start_timer(quick_id, quick)
+    manager.start_timer(slow_id, slow)
+    start = time.monotonic()
+    threading.Thread(target=manager.pause_timer, args=(slow_id,), daemon=True).start()
+    while not quick.on_timer_finished.called and time.monotonic() - start < 3:
+        time.sleep(0.01)
+    assert quick.on_timer_finished.called
+    assert time.monotonic() - start < 1.4
+
+def test_observer_without_every_handler(timer):
+    class TickOnly:
+        def __init__(self):
+            self.ticks = 0
+        def on_timer_tick(self, event):
+            self.ticks += 1
+    obs = TickOnly()
+    timer.add_observer(obs)
+    timer._notify_observers('tick')
+    timer._notify_observers('finished')
+    timer.remove_observer(obs)
+    assert obs.ticks == 1
+    assert obs not in timer.observers.values()
+
+def test_failing_observer_handler_is_disabled(timer, caplog):
+    broken = DummyObserver()
+    broken.on_timer_tick = Mock(side_effect=RuntimeError("boom"))
+    obs = DummyObserver()
+    timer.add_observer(broken)
+    timer.add_observer(obs)
+    timer._notify_observers('tick')
+    # Later observer changes must not bring the disabled handler back
+    timer.add_observer(DummyObserver())
+    timer._notify_observers('tick')
+    assert broken.on_timer_tick.call_count == 1
+    assert obs.ticks == 2
+    timer._notify_observers('finished')
+    assert broken.finished  # Only the failing handler is disabled
+    errors = [r for r in caplog.records if "Observer error" in r.getMessage()]
+    assert len(errors) == 1
+    assert errors[0].exc_info is not None
+
+def test_tick_defers_finish_when_not_allowed(timer):
+    obs = DummyObserver()
+    timer.add_observer(obs)
+    timer.begin()
+    timer._deadline_ns = time.monotonic_ns()  # Time is up
+    assert timer.tick(can_finish=False)
+    assert timer.state == TimerState.RUNNING
+    assert not obs.finished
+    assert not timer.tick()
+    assert timer.state == TimerState.FINISHED
+    assert obs.finished
@@ -2,32 +2,39 @@ import pytest
 from validators import CustomPastaValidator
 
 def test_validate_pasta_name_empty():
-    is_valid, error = CustomPastaValidator.validate_pasta_name('', [])
+    is_valid, error = CustomPastaValidator.validate_pasta_name('', set())
     assert not is_valid
     assert 'cannot be empty' in error
 
 def test_validate_pasta_name_too_short():
-    is_valid, error = CustomPastaValidator.validate_pasta_name('a', [])
+    is_valid, error = CustomPastaValidator.validate_pasta_name('a', set())
     assert not is_valid
     assert 'at least 2 characters' in error
 
 def test_validate_pasta_name_too_long():
-    is_valid, error = CustomPastaValidator.validate_pasta_name('a'*51, [])
+    is_valid, error = CustomPastaValidator.validate_pasta_name('a'*51, set())
     assert not is_valid
     assert '50 characters or less' in error
 
 def test_validate_pasta_name_invalid_chars():
-    is_valid, error = CustomPastaValidator.validate_pasta_name('Spa9hetti!', [])
+    is_valid, error = CustomPastaValidator.validate_pasta_name('Spa9hetti!', set())
     assert not is_valid
     assert 'only contain letters' in error
 
+def test_validate_pasta_name_non_ascii():
+    assert CustomPastaValidator.validate_pasta_name('Strozzapreti à la Crème', set())[0]
+    for name in ('Pennè²', 'Ziti Ⅻ', 'Orzo ½'):
+        is_valid, error = CustomPastaValidator.validate_pasta_name(name, set())
+        assert not is_valid
+        assert 'only contain letters' in error
+
 def test_validate_pasta_name_duplicate():
-    is_valid, error = CustomPastaValidator.validate_pasta_name('Spaghetti', ['spaghetti'])
+    is_valid, error = CustomPastaValidator.validate_pasta_name('Spaghetti', {'spaghetti'})
     assert not is_valid
     assert 'already exists' in error
 
 def test_validate_pasta_name_valid():
-    is_valid, error = CustomPastaValidator.validate_pasta_name('Fusilli', ['spaghetti'])
+    is_valid, error = CustomPastaValidator.validate_pasta_name('Fusilli', {'spaghetti'})
     assert is_valid
     assert error == ''
 
@@ -1,158 +1,331 @@
+import os
+import sys
 import time
-from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+import atexit
+import logging
+import importlib.util
+import heapq
+import functools
+from typing import List, Optional, Dict, Set, Tuple, Protocol, Callable
 import threading
-import multiprocessing
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
 from models import TimerState, TimerEvent
 
-try:
-    from playsound3 import playsound
-    SOUND_AVAILABLE = True
-except ImportError:
-    SOUND_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
-try:
-    from plyer import notification
-    DESKTOP_NOTIFICATIONS_AVAILABLE = True
-except ImportError:
-    DESKTOP_NOTIFICATIONS_AVAILABLE = False
+# playsound3 and plyer load platform backends on import, so only check that they
+# are installed here and import them when a notification actually goes out
+SOUND_AVAILABLE = importlib.util.find_spec("playsound3") is not None
+DESKTOP_NOTIFICATIONS_AVAILABLE = importlib.util.find_spec("plyer") is not None
 
+# Length of every timer when running in debug mode
+DEBUG_TIMER_SECONDS = 6
 
-class TimerObserver(ABC):
-    """Abstract base class for timer observers"""
+# Countdown arithmetic is done in integer nanoseconds from time.monotonic_ns()
+_NS_PER_SECOND = 1_000_000_000
+
+# Ticks landing this close past a whole second still count as on it
+_TICK_SLACK_NS = 10_000_000
+
+# Lowercase pasta name -> desktop notification icon path; anything missing uses
+# the system default, e.g. 'spaghetti': 'icons/spaghetti.png'
+NOTIFICATION_ICONS: Dict[str, str] = {}
+
+# Timer states that can begin() counting down / that a countdown is still underway in
+_STARTABLE_STATES = frozenset({TimerState.IDLE, TimerState.PAUSED})
+_ACTIVE_STATES = frozenset({TimerState.RUNNING, TimerState.PAUSED})
+
+# Timer statuses that cleanup_finished_timers removes
+_DONE_STATUSES = frozenset({'finished', 'cancelled', 'error'})
+
+# Event type -> TimerObserver method that handles it
+_EVENT_DISPATCH = {
+    "tick": "on_timer_tick",
+    "finished": "on_timer_finished",
+    "cancelled": "on_timer_cancelled",
+    "paused": "on_timer_paused",
+    "resumed": "on_timer_resumed",
+}
+
+
+class TimerObserver(Protocol):
+    """Interface for timer observers"""
     
-    @abstractmethod
     def on_timer_tick(self, event: TimerEvent) -> None:
-        """Called every second during timer countdown"""
+        """Called every second during timer countdown.
+        The same event object is reused for every tick, so copy it to keep it."""
         pass
     
-    @abstractmethod
     def on_timer_finished(self, event: TimerEvent) -> None:
         """Called when timer completes"""
         pass
     
-    @abstractmethod
     def on_timer_cancelled(self, event: TimerEvent) -> None:
         """Called when timer is cancelled"""
         pass
     
-    @abstractmethod
     def on_timer_paused(self, event: TimerEvent) -> None:
         """Called when timer is paused"""
         pass
     
-    @abstractmethod
     def on_timer_resumed(self, event: TimerEvent) -> None:
         """Called when timer is resumed"""
         pass
 
 
+@functools.cache
+def _raise_timer_resolution() -> None:
+    """Ask Windows for 1 ms timer resolution so tick waits end on time instead of up to
+    15.6 ms late. Called when the first timer starts; the raised resolution then holds for
+    the rest of the process, until atexit restores it. Other platforms already wake
+    precisely enough, so this does nothing there."""
+    if sys.platform != "win32":
+        return
+    
+    try:
+        import ctypes
+        winmm = ctypes.WinDLL("winmm")
+        if winmm.timeBeginPeriod(1) == 0:  # TIMERR_NOERROR
+            atexit.register(winmm.timeEndPeriod, 1)
+    except OSError:
+        pass  # Default resolution still works, just with more jitter
+
+
 class PastaTimer:
     """Core pasta timer class - independent of UI"""
     
+    __slots__ = (
+        'pasta_type', 'minutes', 'debug_mode', 'state', 'observers', 'total_seconds',
+        'remaining_seconds', '_observer_lock', '_callbacks', '_failed_handlers', '_wake', '_deadline_ns', '_remaining_at_pause_ns', '_tick_event',
+    )
+    
     def __init__(self, pasta_type: str, minutes: float, debug_mode: bool = False):
         self.pasta_type = pasta_type
         self.minutes = minutes
         self.debug_mode = debug_mode
         self.state = TimerState.IDLE
-        self.observers: List[TimerObserver] = []
-        self.total_seconds = int(minutes * 60) if not debug_mode else 6
+        self.observers: Dict[int, TimerObserver] = {}  # id(observer) -> observer
+        # Guards observers, _callbacks and _failed_handlers, which the ticking thread
+        # updates when a handler fails while the UI thread adds or removes observers
+        self._observer_lock = threading.Lock()
+        # event type -> (id(observer), bound handler) pairs, rebuilt whenever the observers change
+        self._callbacks: Dict[str, Tuple[Tuple[int, Callable[[TimerEvent], None]], ...]] = {
+            event_type: () for event_type in _EVENT_DISPATCH
+        }
+        # (id(observer), event type) handlers that raised and are no longer called
+        self._failed_handlers: Set[Tuple[int, str]] = set()
+        self.total_seconds = DEBUG_TIMER_SECONDS if debug_mode else int(minutes * 60)
         self.remaining_seconds = self.total_seconds
-        self._pause_event = threading.Event()
-        self._pause_event.set()  # Start unpaused
+        self._wake = threading.Event()  # Set on every state change to interrupt start()'s waits
+        self._deadline_ns: Optional[int] = None  # time.monotonic_ns() at which a running timer ends
+        self._remaining_at_pause_ns = self.total_seconds * _NS_PER_SECOND  # Unrounded, so pausing loses no time
+        self._tick_event = TimerEvent("tick", self.remaining_seconds, pasta_type)
     
     def add_observer(self, observer: TimerObserver) -> None:
         """Add an observer to receive timer events"""
-        self.observers.append(observer)
+        with self._observer_lock:
+            self.observers[id(observer)] = observer
+            self._rebuild_callbacks()
     
     def remove_observer(self, observer: TimerObserver) -> None:
         """Remove an observer"""
-        if observer in self.observers:
-            self.observers.remove(observer)
+        observer_id = id(observer)
+        with self._observer_lock:
+            if self.observers.pop(observer_id, None) is not None:
+                # Its id may be reused by a later observer, which starts with a clean slate
+                self._failed_handlers = {
+                    handler for handler in self._failed_handlers if handler[0] != observer_id
+                }
+                self._rebuild_callbacks()
+    
+    def _rebuild_callbacks(self) -> None:
+        """Bind each event's handler once per observer change instead of looking it up per event,
+        leaving out handlers that have failed or that the observer doesn't define. Fresh tuples
+        are swapped in, so a notification already in progress is unaffected. Caller must hold
+        _observer_lock."""
+        self._callbacks = {
+            event_type: tuple(
+                (observer_id, handler)
+                for observer_id, observer in self.observers.items()
+                if (observer_id, event_type) not in self._failed_handlers
+                and (handler := getattr(observer, method_name, None)) is not None
+            )
+            for event_type, method_name in _EVENT_DISPATCH.items()
+        }
     
     def _notify_observers(self, event_type: str, additional_data: Optional[Dict] = None) -> None:
         """Notify all observers of a timer event"""
-        event = TimerEvent(event_type, self.remaining_seconds, self.pasta_type, additional_data)
+        callbacks = self._callbacks[event_type]
+        if not callbacks:
+            return  # Nobody listening, so don't build or refill an event
+        
+        if event_type == "tick":
+            # Ticks are the hot path, so one event object is refilled for each of them
+            event = self._tick_event
+            event.remaining_seconds = self.remaining_seconds
+            event.additional_data = additional_data
+        else:
+            event = TimerEvent(event_type, self.remaining_seconds, self.pasta_type, additional_data)
         
-        for observer in self.observers:
+        for observer_id, callback in callbacks:
             try:
-                if event_type == "tick":
-                    observer.on_timer_tick(event)
-                elif event_type == "finished":
-                    observer.on_timer_finished(event)
-                elif event_type == "cancelled":
-                    observer.on_timer_cancelled(event)
-                elif event_type == "paused":
-                    observer.on_timer_paused(event)
-                elif event_type == "resumed":
-                    observer.on_timer_resumed(event)
-            except Exception as e:
-                # Don't let observer errors crash the timer
-                print(f"Observer error: {e}")
-    
-    def start(self) -> None:
-        """Start the timer countdown"""
-        if self.state not in [TimerState.IDLE, TimerState.PAUSED]:
+                callback(event)
+            except Exception:
+                # Don't let observer errors crash the timer, and stop calling a handler
+                # that failed so a broken observer reports once rather than every tick
+                logger.exception("Observer error in %r handler; disabling it", event_type)
+                with self._observer_lock:
+                    self._failed_handlers.add((observer_id, event_type))
+                    self._rebuild_callbacks()
+    
+    def begin(self) -> None:
+        """Switch the timer to running without blocking; the caller then drives tick()"""
+        if self.state not in _STARTABLE_STATES:
             raise ValueError(f"Timer cannot be started from state: {self.state}")
         
         self.state = TimerState.RUNNING
+        self._deadline_ns = time.monotonic_ns() + self._remaining_at_pause_ns
+        self._wake.set()
+    
+    def ns_left(self) -> int:
+        """Nanoseconds left on the countdown, measured against the monotonic deadline"""
+        if self.state == TimerState.RUNNING:
+            return max(0, self._deadline_ns - time.monotonic_ns())
+        if self.state in _STARTABLE_STATES:
+            return self._remaining_at_pause_ns
+        return self.remaining_seconds * _NS_PER_SECOND
+    
+    def time_left(self) -> float:
+        """Seconds left on the countdown, measured against the monotonic deadline"""
+        return self.ns_left() / _NS_PER_SECOND
+    
+    def ns_to_next_tick(self) -> int:
+        """Nanoseconds until the countdown next reaches a whole second, so ticks stay on the deadline's grid"""
+        left = self.ns_left()
+        whole_seconds = -(-(left - _TICK_SLACK_NS) // _NS_PER_SECOND)  # Ceiling division
+        return left - (whole_seconds - 1) * _NS_PER_SECOND
+    
+    def tick(self, ticks_skipped: int = 0, can_finish: bool = True) -> bool:
+        """Refresh the countdown and notify observers, firing 'finished' once time is up.
+        ticks_skipped counts missed ticks this one stands in for. With can_finish False a
+        tick that finds time up does nothing and returns True, leaving the finish to the
+        caller's next tick. Returns True while further ticks are due."""
+        if self.state != TimerState.RUNNING:
+            return False
+        
+        left = self.ns_left()
+        if left <= _TICK_SLACK_NS:
+            if not can_finish:
+                return True
+            self.remaining_seconds = 0
+            self.state = TimerState.FINISHED
+            self._notify_observers("finished")
+            return False
+        
+        # Nearest whole second, but 0 is only ever shown by the finish
+        self.remaining_seconds = max(1, (left + _NS_PER_SECOND // 2) // _NS_PER_SECOND)
+        self._notify_observers("tick", {"ticks_skipped": ticks_skipped} if ticks_skipped else None)
+        return True
+    
+    def start(self) -> None:
+        """Start the timer countdown, blocking until it finishes or is cancelled"""
+        _raise_timer_resolution()
+        self.begin()
         
         try:
-            while self.remaining_seconds > 0 and self.state in [TimerState.RUNNING, TimerState.PAUSED]:
-                # Wait if paused
-                self._pause_event.wait()
-                
-                # Check if state changed while waiting
-                if self.state != TimerState.RUNNING:
+            next_tick = time.monotonic_ns()
+            while self.state in _ACTIVE_STATES:
+                # Clear before reading the state, so a change made after this still ends the wait
+                self._wake.clear()
+                if self.state == TimerState.PAUSED:
+                    self._wake.wait()
+                    next_tick = time.monotonic_ns()
                     continue
                 
-                self._notify_observers("tick")
-                time.sleep(1)
-                self.remaining_seconds -= 1
-            
-            if self.state == TimerState.RUNNING:
-                self.state = TimerState.FINISHED
-                self._notify_observers("finished")
+                # If observers ran late, fold the missed ticks into this one instead of firing a burst
+                missed = max(0, (time.monotonic_ns() - next_tick) // _NS_PER_SECOND)
+                if self.tick(missed):
+                    # Sleep until the next whole second of the countdown, but wake at once on pause or cancel
+                    wait_ns = self.ns_to_next_tick()
+                    next_tick = time.monotonic_ns() + wait_ns
+                    self._wake.wait(timeout=wait_ns / _NS_PER_SECOND)
         except KeyboardInterrupt:
             self.cancel()
     
-    def pause(self) -> None:
-        """Pause the timer"""
-        if self.state == TimerState.RUNNING:
-            self.state = TimerState.PAUSED
-            self._pause_event.clear()
+    def pause(self, notify: bool = True) -> bool:
+        """Pause the timer. With notify False the caller must send the 'paused' event.
+        Returns True if the timer was running."""
+        if self.state != TimerState.RUNNING:
+            return False
+        
+        self._remaining_at_pause_ns = self.ns_left()
+        self.remaining_seconds = (self._remaining_at_pause_ns + _NS_PER_SECOND // 2) // _NS_PER_SECOND
+        self.state = TimerState.PAUSED
+        self._wake.set()
+        if notify:
             self._notify_observers("paused")
+        return True
     
-    def resume(self) -> None:
-        """Resume the timer from paused state"""
-        if self.state == TimerState.PAUSED:
-            self.state = TimerState.RUNNING
-            self._pause_event.set()
+    def resume(self, notify: bool = True) -> bool:
+        """Resume the timer from paused state. With notify False the caller must send the
+        'resumed' event. Returns True if the timer was paused."""
+        if self.state != TimerState.PAUSED:
+            return False
+        
+        self._deadline_ns = time.monotonic_ns() + self._remaining_at_pause_ns
+        self.state = TimerState.RUNNING
+        self._wake.set()
+        if notify:
             self._notify_observers("resumed")
+        return True
     
-    def cancel(self) -> None:
-        """Cancel the timer"""
-        if self.state in [TimerState.RUNNING, TimerState.PAUSED]:
-            self.state = TimerState.CANCELLED
-            self._pause_event.set()  # Unblock if paused
+    def cancel(self, notify: bool = True) -> bool:
+        """Cancel the timer. With notify False the caller must send the 'cancelled' event.
+        Returns True if the timer was running or paused."""
+        if self.state not in _ACTIVE_STATES:
+            return False
+        
+        self.state = TimerState.CANCELLED
+        self._wake.set()
+        if notify:
             self._notify_observers("cancelled")
+        return True
     
     def reset(self) -> None:
         """Reset the timer to initial state"""
         self.state = TimerState.IDLE
         self.remaining_seconds = self.total_seconds
-        self._pause_event.set()  # Ensure unpaused
+        self._remaining_at_pause_ns = self.total_seconds * _NS_PER_SECOND
+        self._deadline_ns = None
+        self._wake.clear()
+
+
+@dataclass(slots=True)
+class TimerInfo:
+    """Bookkeeping TimerManager keeps for each managed timer"""
+    id: str
+    pasta_type: str
+    minutes: float
+    timer: PastaTimer
+    tick_generation: int = 0  # Bumped to drop ticks already queued for this timer
+    start_time: datetime = field(default_factory=datetime.now)
+    status: str = 'created'
+    error: Optional[str] = None
 
 
 class TimerManager:
     """Manages multiple concurrent pasta timers"""
     
     def __init__(self):
-        self.active_timers: Dict[str, Dict] = {}  # timer_id -> timer_info
+        self.active_timers: Dict[str, TimerInfo] = {}
         self.timer_counter = 0
         self.lock = threading.Lock()
+        # One scheduler thread ticks every timer from a heap of (due, generation, timer_id)
+        self._wakeup = threading.Condition(self.lock)
+        self._tick_heap: List[Tuple[int, int, str]] = []  # due is in time.monotonic_ns()
+        self._scheduler_thread: Optional[threading.Thread] = None
     
     def add_timer(self, pasta_type: str, minutes: float, debug_mode: bool = False) -> str:
         """Add a new timer and return its ID"""
@@ -160,17 +333,12 @@ class TimerManager:
             self.timer_counter += 1
             timer_id = f"timer_{self.timer_counter}"
             
-            timer_info = {
-                'id': timer_id,
-                'pasta_type': pasta_type,
-                'minutes': minutes,
-                'timer': PastaTimer(pasta_type, minutes, debug_mode),
-                'thread': None,
-                'start_time': datetime.now(),
-                'status': 'created'
-            }
-            
-            self.active_timers[timer_id] = timer_info
+            self.active_timers[timer_id] = TimerInfo(
+                id=timer_id,
+                pasta_type=pasta_type,
+                minutes=minutes,
+                timer=PastaTimer(pasta_type, minutes, debug_mode)
+            )
             return timer_id
     
     def start_timer(self, timer_id: str, observer: TimerObserver) -> bool:
@@ -180,31 +348,101 @@ class TimerManager:
                 return False
             
             timer_info = self.active_timers[timer_id]
-            timer_info['timer'].add_observer(observer)
-            timer_info['status'] = 'running'
-            
-            # Start timer in a separate thread
-            def run_timer():
-                try:
-                    timer_info['timer'].start()
-                    with self.lock:
-                        if timer_id in self.active_timers:
-                            if timer_info['timer'].state.name == 'FINISHED':
-                                timer_info['status'] = 'finished'
-                            elif timer_info['timer'].state.name == 'CANCELLED':
-                                timer_info['status'] = 'cancelled'
-                            elif timer_info['timer'].state.name == 'PAUSED':
-                                timer_info['status'] = 'paused'
-                except Exception as e:
-                    with self.lock:
-                        if timer_id in self.active_timers:
-                            timer_info['status'] = 'error'
-                            timer_info['error'] = str(e)
+            timer_info.timer.add_observer(observer)
+            try:
+                timer_info.timer.begin()
+            except ValueError as e:
+                timer_info.status = 'error'
+                timer_info.error = str(e)
+                return False
             
-            timer_info['thread'] = threading.Thread(target=run_timer, daemon=True)
-            timer_info['thread'].start()
+            timer_info.status = 'running'
+            self._schedule_tick(timer_id, timer_info)
             return True
     
+    def _schedule_tick(self, timer_id: str, timer_info: TimerInfo) -> None:
+        """Queue an immediate tick, superseding any tick already queued. Caller must hold the lock."""
+        timer_info.tick_generation += 1
+        heapq.heappush(self._tick_heap, (time.monotonic_ns(), timer_info.tick_generation, timer_id))
+        
+        if self._scheduler_thread is None:
+            _raise_timer_resolution()
+            self._scheduler_thread = threading.Thread(
+                target=self._run_scheduler, name="pasta-scheduler", daemon=True
+            )
+            self._scheduler_thread.start()
+        self._wakeup.notify()
+    
+    def _run_scheduler(self) -> None:
+        """Fire due ticks for every running timer from a single background thread"""
+        with self._wakeup:
+            while True:
+                if not self._tick_heap:
+                    self._wakeup.wait()
+                    continue
+                
+                due, generation, timer_id = self._tick_heap[0]
+                delay_ns = due - time.monotonic_ns()
+                if delay_ns > 0:
+                    self._wakeup.wait(timeout=delay_ns / _NS_PER_SECOND)
+                    continue
+                
+                heapq.heappop(self._tick_heap)
+                timer_info = self.active_timers.get(timer_id)
+                if timer_info is None or timer_info.tick_generation != generation:
+                    continue  # Removed, or superseded by a resume
+                
+                timer = timer_info.timer
+                if timer.state != TimerState.RUNNING:
+                    continue  # Paused timers are queued again when resumed
+                
+                if timer.ns_left() <= _TICK_SLACK_NS:
+                    # This tick fires 'finished', whose observers may block (the CLI waits
+                    # for Enter), so run it on its own thread rather than stall other timers
+                    threading.Thread(
+                        target=self._run_tick, args=(timer_id, timer_info), name=f"pasta-{timer_id}-finish", daemon=True
+                    ).start()
+                    continue
+                
+                # Slots missed while observers ran late collapse into this one tick
+                missed = max(0, (time.monotonic_ns() - due) // _NS_PER_SECOND)
+                
+                # Observers run without the lock so they can call back into the manager. If the
+                # deadline passes meanwhile, the tick declines to finish here and is queued
+                # again at once, so 'finished' still only ever runs on a finish thread
+                self._wakeup.release()
+                try:
+                    keep_ticking = self._run_tick(timer_id, timer_info, missed, can_finish=False)
+                finally:
+                    self._wakeup.acquire()
+                
+                if keep_ticking and timer_info.tick_generation == generation:
+                    # Every timer ticks on the same whole-second grid, so one wakeup serves them
+                    # all; only the finish is scheduled off-grid, at the timer's exact deadline
+                    now = time.monotonic_ns()
+                    next_due = min((now // _NS_PER_SECOND + 1) * _NS_PER_SECOND, now + timer.ns_left())
+                    heapq.heappush(self._tick_heap, (next_due, generation, timer_id))
+    
+    def _run_tick(self, timer_id: str, timer_info: TimerInfo, ticks_skipped: int = 0,
+                  can_finish: bool = True) -> bool:
+        """Tick a timer without holding the lock. Returns True if it needs another tick."""
+        timer = timer_info.timer
+        try:
+            if timer.tick(ticks_skipped, can_finish):
+                return True
+        except Exception as e:
+            with self.lock:
+                if timer_id in self.active_timers:
+                    timer_info.status = 'error'
+                    timer_info.error = str(e)
+            return False
+        
+        if timer.state == TimerState.FINISHED:
+            with self.lock:
+                if timer_id in self.active_timers:
+                    timer_info.status = 'finished'
+        return False
+    
     def pause_timer(self, timer_id: str) -> bool:
         """Pause a specific timer"""
         with self.lock:
@@ -212,11 +450,17 @@ class TimerManager:
                 return False
             
             timer_info = self.active_timers[timer_id]
-            if timer_info['status'] == 'running':
-                timer_info['timer'].pause()
-                timer_info['status'] = 'paused'
-                return True
-            return False
+            if timer_info.status != 'running':
+                return False
+            
+            paused = timer_info.timer.pause(notify=False)
+            timer_info.status = 'paused'
+        
+        # The lock is also the scheduler's, so observers run after releasing it;
+        # a slow handler must not hold up every other timer's ticks
+        if paused:
+            timer_info.timer._notify_observers("paused")
+        return True
     
     def resume_timer(self, timer_id: str) -> bool:
         """Resume a specific timer"""
@@ -225,11 +469,20 @@ class TimerManager:
                 return False
             
             timer_info = self.active_timers[timer_id]
-            if timer_info['status'] == 'paused':
-                timer_info['timer'].resume()
-                timer_info['status'] = 'running'
-                return True
-            return False
+            if timer_info.status != 'paused':
+                return False
+            
+            resumed = timer_info.timer.resume(notify=False)
+            timer_info.status = 'running'
+        
+        if resumed:
+            timer_info.timer._notify_observers("resumed")
+        
+        # Queue the first tick only now, so observers see 'resumed' before it
+        with self.lock:
+            if self.active_timers.get(timer_id) is timer_info and timer_info.status == 'running':
+                self._schedule_tick(timer_id, timer_info)
+        return True
     
     def cancel_timer(self, timer_id: str) -> bool:
         """Cancel a specific timer"""
@@ -238,9 +491,12 @@ class TimerManager:
                 return False
             
             timer_info = self.active_timers[timer_id]
-            timer_info['timer'].cancel()
-            timer_info['status'] = 'cancelled'
-            return True
+            cancelled = timer_info.timer.cancel(notify=False)
+            timer_info.status = 'cancelled'
+        
+        if cancelled:
+            timer_info.timer._notify_observers("cancelled")
+        return True
     
     def remove_timer(self, timer_id: str) -> bool:
         """Remove a timer from management"""
@@ -249,47 +505,56 @@ class TimerManager:
                 return False
             
             timer_info = self.active_timers[timer_id]
-            if timer_info['status'] == 'running':
-                timer_info['timer'].cancel()
-            
+            cancelled = timer_info.status == 'running' and timer_info.timer.cancel(notify=False)
             del self.active_timers[timer_id]
-            return True
+        
+        if cancelled:
+            timer_info.timer._notify_observers("cancelled")
+        return True
     
     def get_active_timers(self) -> List[Dict]:
         """Get list of all active timers"""
+        # Only copy references under the lock; build the result dicts outside it
         with self.lock:
-            return [
-                {
-                    'id': timer_info['id'],
-                    'pasta_type': timer_info['pasta_type'],
-                    'minutes': timer_info['minutes'],
-                    'status': timer_info['status'],
-                    'start_time': timer_info['start_time'],
-                    'remaining_seconds': timer_info['timer'].remaining_seconds if timer_info['status'] == 'running' else 0,
-                    'total_seconds': timer_info['timer'].total_seconds
-                }
-                for timer_info in self.active_timers.values()
+            snapshot = [
+                (timer_info, timer_info.status) for timer_info in self.active_timers.values()
             ]
+        
+        return [
+            {
+                'id': timer_info.id,
+                'pasta_type': timer_info.pasta_type,
+                'minutes': timer_info.minutes,
+                'status': status,
+                'start_time': timer_info.start_time,
+                'remaining_seconds': timer_info.timer.remaining_seconds if status == 'running' else 0,
+                'total_seconds': timer_info.timer.total_seconds
+            }
+            for timer_info, status in snapshot
+        ]
     
     def cleanup_finished_timers(self) -> None:
         """Remove finished and cancelled timers"""
         with self.lock:
-            to_remove = [
-                timer_id for timer_id, timer_info in self.active_timers.items()
-                if timer_info['status'] in ['finished', 'cancelled', 'error']
-            ]
-            for timer_id in to_remove:
-                del self.active_timers[timer_id]
+            self.active_timers = {
+                timer_id: timer_info for timer_id, timer_info in self.active_timers.items()
+                if timer_info.status not in _DONE_STATUSES
+            }
 
 
 class NotificationManager:
     """Handles both sound and desktop notifications"""
     
-    def __init__(self, sound_file: str = "alarm.mp3"):
+    def __init__(self, sound_file: Optional[str] = None):
+        # The bundled alarm lives next to this module; a caller-supplied path is used
+        # as given. Checking it exists once means a missing file never spawns a player.
+        if sound_file is None:
+            sound_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alarm.mp3")
         self.sound_file = sound_file
-        self.sound_enabled = SOUND_AVAILABLE
+        self.sound_enabled = SOUND_AVAILABLE and os.path.isfile(sound_file)
         self.desktop_enabled = DESKTOP_NOTIFICATIONS_AVAILABLE
-        self.sound_process = None
+        self._notify: Optional[Callable[..., None]] = None  # Bound on first desktop notification
+        self._sound_handle = None  # playsound3 Sound for the alarm currently playing
     
     def show_notification(self, title: str, message: str, pasta_type: str = "", play_sound: bool = True) -> Dict[str, bool]:
         """Show both desktop and sound notifications. Returns status of each notification type."""
@@ -312,56 +577,52 @@ class NotificationManager:
         if not self.desktop_enabled:
             return False
         
-        try:
-            # Choose an appropriate icon based on pasta type or use default
-            app_icon = self._get_notification_icon(pasta_type)
+        if self._notify is None:
+            try:
+                from plyer import notification
+            except ImportError:
+                # Installed but unusable; stop retrying and let the UI offer its install hint
+                self.desktop_enabled = False
+                return False
             
-            notification.notify(
-                title=title,
-                message=message,
+            # Arguments shared by every desktop notification, bound once
+            self._notify = functools.partial(
+                notification.notify,
                 app_name="Pasta Timer",
-                app_icon=app_icon,
                 timeout=10,  # Show for 10 seconds
                 toast=True   # Use toast notification on Windows
             )
+        
+        try:
+            # Pasta-specific icon if one is configured, otherwise the system default
+            self._notify(title=title, message=message, app_icon=NOTIFICATION_ICONS.get(pasta_type.lower()))
             return True
         except Exception as e:
             # Fail silently - desktop notifications are not critical
             return False
     
-    def _get_notification_icon(self, pasta_type: str = "") -> Optional[str]:
-        """Get appropriate notification icon based on pasta type or return None for default."""
-        # You can add custom icons here based on pasta type
-        # For now, return None to use system default
-        # In the future, you could add pasta-specific icons like:
-        # icon_map = {
-        #     'spaghetti': 'icons/spaghetti.png',
-        #     'penne': 'icons/penne.png',
-        #     # ... etc
-        # }
-        # return icon_map.get(pasta_type.lower(), None)
-        return None
-    
     def _play_sound_notification(self) -> bool:
-        """Play notification sound in a separate process. Returns True if successful."""
+        """Play notification sound in the background. Returns True if successful."""
         if not self.sound_enabled:
             return False
         
         try:
             # Stop any currently playing sound
             self.stop_sound()
-            # Start new sound process
-            self.sound_process = multiprocessing.Process(target=playsound, args=(self.sound_file,))
-            self.sound_process.start()
+            from playsound3 import playsound
+            
+            # Non-blocking playback returns a handle that stop_sound can end
+            self._sound_handle = playsound(self.sound_file, block=False)
             return True
         except Exception:
             return False
     
     def stop_sound(self) -> None:
         """Stop the currently playing notification sound."""
-        if self.sound_process and self.sound_process.is_alive():
-            self.sound_process.terminate()
-            self.sound_process.join(timeout=1.0)  # Wait up to 1 second for clean termination
+        if self._sound_handle is not None:
+            if self._sound_handle.is_alive():
+                self._sound_handle.stop()
+            self._sound_handle = None  # Let the finished player be collected
     
     def get_capabilities(self) -> Dict[str, bool]:
         """Get available notification capabilities."""
@@ -1,12 +1,25 @@
-from typing import List, Tuple
+import string
+from typing import AbstractSet, Tuple
+
+# Every byte an ASCII name may not contain, so bytes.translate can strip them in C
+_ASCII_NAME_DELETE = bytes(b for b in range(256) if chr(b) not in string.ascii_letters + " '-")
+
+# Cooking time rules, checked in order; each is a predicate over (min_time, max_time) that
+# flags a failure. Later ones assume earlier ones passed (e.g. that both times are ints).
+_COOKING_TIME_CHECKS = (
+    (lambda lo, hi: not isinstance(lo, int) or not isinstance(hi, int), "Cooking times must be whole numbers"),
+    (lambda lo, hi: lo < 1 or hi < 1, "Cooking times must be at least 1 minute"),
+    (lambda lo, hi: lo > 60 or hi > 60, "Cooking times must be 60 minutes or less"),
+    (lambda lo, hi: lo > hi, "Minimum time cannot be greater than maximum time"),
+)
 
 
 class CustomPastaValidator:
     """Validates custom pasta input data"""
     
     @staticmethod
-    def validate_pasta_name(name: str, existing_names: List[str]) -> Tuple[bool, str]:
-        """Validate pasta name. Returns (is_valid, error_message)"""
+    def validate_pasta_name(name: str, existing_names: AbstractSet[str]) -> Tuple[bool, str]:
+        """Validate pasta name against a set of existing lowercase names. Returns (is_valid, error_message)"""
         if not name or not name.strip():
             return False, "Pasta name cannot be empty"
         
@@ -18,11 +31,17 @@ class CustomPastaValidator:
             return False, "Pasta name must be 50 characters or less"
         
         # Check for valid characters (letters, spaces, hyphens, apostrophes)
-        if not all(c.isalpha() or c in " -'" for c in name):
+        if name.isascii():
+            raw = name.encode('ascii')
+            valid_chars = len(raw.translate(None, _ASCII_NAME_DELETE)) == len(raw)
+        else:
+            # Letters from any script; str.isalpha also rules out numerics such as '²' or 'Ⅻ'
+            valid_chars = all(c.isalpha() or c in " -'" for c in name)
+        if not valid_chars:
             return False, "Pasta name can only contain letters, spaces, hyphens, and apostrophes"
         
         # Check for uniqueness (case-insensitive)
-        if name.lower() in [n.lower() for n in existing_names]:
+        if name.lower() in existing_names:
             return False, f"A pasta type named '{name}' already exists"
         
         return True, ""
@@ -30,16 +49,8 @@ class CustomPastaValidator:
     @staticmethod
     def validate_cooking_time(min_time: int, max_time: int) -> Tuple[bool, str]:
         """Validate cooking times. Returns (is_valid, error_message)"""
-        if not isinstance(min_time, int) or not isinstance(max_time, int):
-            return False, "Cooking times must be whole numbers"
-        
-        if min_time < 1 or max_time < 1:
-            return False, "Cooking times must be at least 1 minute"
-        
-        if min_time > 60 or max_time > 60:
-            return False, "Cooking times must be 60 minutes or less"
-        
-        if min_time > max_time:
-            return False, "Minimum time cannot be greater than maximum time"
+        for failed, message in _COOKING_TIME_CHECKS:
+            if failed(min_time, max_time):
+                return False, message
         
         return True, ""